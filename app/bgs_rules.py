@@ -1,4 +1,5 @@
 """Functions for each of the BGS data validation rules"""
+from functools import cache
 from pathlib import Path
 from typing import List
 
@@ -43,7 +44,7 @@ def check_required_groups(tables: dict) -> List[dict]:
         missing.append('(LOCA or HOLE)')
 
     if missing:
-        desc = 'Required groups not present: ' + ', '.join(missing)
+        desc = f"Required groups not present: {', '.join(missing)}"
         errors.append({'line': '-', 'group': '', 'desc': desc})
 
     return errors
@@ -60,7 +61,7 @@ def check_required_bgs_groups(tables: dict) -> List[dict]:
             missing.append(group)
 
     if missing:
-        desc = 'Required BGS groups not present: ' + ', '.join(missing)
+        desc = f"Required BGS groups not present: {', '.join(missing)}"
         errors.append({'line': '-', 'group': '', 'desc': desc})
 
     return errors
@@ -176,10 +177,7 @@ def check_drill_depth_geol_record(tables: dict) -> List[dict]:
 
 def check_loca_within_great_britain(tables: dict) -> List[dict]:
     """Location coordinates fall on land within Great Britain."""
-    gb_outline = gpd.read_file(GB_OUTLINE).loc[0, 'geometry']
-    ni_outline = gpd.read_file(NI_OUTLINE).loc[0, 'geometry']
-    uk_eea_outline_wgs84 = gpd.read_file(UK_EEA_OUTLINE)
-    uk_eea_outline = uk_eea_outline_wgs84.to_crs('EPSG:27700').loc[0, 'geometry']
+    gb_outline, ni_outline, uk_eea_outline = _load_country_outlines()
     errors = []
 
     # Read data into geodataframe
@@ -220,6 +218,20 @@ def check_loca_within_great_britain(tables: dict) -> List[dict]:
     return errors
 
 
+@cache
+def _load_country_outlines() -> tuple:
+    """
+    Read the GB, NI and UK EEA outlines.  These are the same for every file,
+    so they are read and reprojected once per process and then reused.
+    """
+    gb_outline = gpd.read_file(GB_OUTLINE).loc[0, 'geometry']
+    ni_outline = gpd.read_file(NI_OUTLINE).loc[0, 'geometry']
+    uk_eea_outline_wgs84 = gpd.read_file(UK_EEA_OUTLINE)
+    uk_eea_outline = uk_eea_outline_wgs84.to_crs('EPSG:27700').loc[0, 'geometry']
+
+    return gb_outline, ni_outline, uk_eea_outline
+
+
 def create_location_gpd(tables: dict[pd.DataFrame]) -> gpd.GeoDataFrame:
     location: pd.DataFrame = tables['LOCA'].set_index('LOCA_ID')
     location['geometry'] = list(zip(location['LOCA_NATE'], location['LOCA_NATN']))
@@ -332,20 +344,29 @@ def check_sample_referencing(tables: dict) -> List[dict]:
         id_pairs['samp_id'].fillna(id_pairs['comp_id'], inplace=True)
         return id_pairs
 
-    def id_pair(row, group):
-        id_keys = get_group_id_keys(group)
-
+    def id_pair(row, samp_id_keys, comp_id_keys):
+        """ Create ids from keys, which are None if not all in the table """
         samp_id = None
-        if (set(id_keys['samp_id_keys']) <= set(row.keys())
-                and values_all_valid(row, id_keys['samp_id_keys'])):
-            samp_id = id_from_keys(row, id_keys['samp_id_keys'])
+        if samp_id_keys and values_all_valid(row, samp_id_keys):
+            samp_id = id_from_keys(row, samp_id_keys)
 
         comp_id = None
-        if (set(id_keys['comp_id_keys']) <= set(row.keys())
-                and values_all_valid(row, id_keys['comp_id_keys'])):
-            comp_id = id_from_keys(row, id_keys['comp_id_keys'])
+        if comp_id_keys and values_all_valid(row, comp_id_keys):
+            comp_id = id_from_keys(row, comp_id_keys)
         return pd.Series([samp_id, comp_id])
 
+    def table_id_pairs(table: pd.DataFrame, group: str) -> pd.DataFrame:
+        """ Create id pairs for each row, using the id keys for group """
+        # All rows share the table columns, so check key presence just once
+        id_keys = get_group_id_keys(group)
+        columns = set(table.columns)
+        samp_id_keys = id_keys['samp_id_keys'] if set(id_keys['samp_id_keys']) <= columns else None
+        comp_id_keys = id_keys['comp_id_keys'] if set(id_keys['comp_id_keys']) <= columns else None
+
+        id_pairs = table.apply(id_pair, axis=1, args=(samp_id_keys, comp_id_keys))
+        id_pairs.columns = ['samp_id', 'comp_id']
+        return id_pairs
+
     def child_consistency(samp_ids, tables: dict) -> List[dict]:
         errors = []
         children = []
@@ -357,13 +378,11 @@ def check_sample_referencing(tables: dict) -> List[dict]:
                 children.append(group)
 
         for group in children:
-            child_id_pairs = tables[group].apply(id_pair, axis=1, args=(group,))
-            child_id_pairs.columns = ['samp_id', 'comp_id']
+            child_id_pairs = table_id_pairs(tables[group], group)
             errors, child_id_pairs = internal_consistency(group, child_id_pairs)
 
             # Parent ids refer to keys used by SAMP with extra fields
-            parent_id_pairs = tables[group].apply(id_pair, axis=1, args=('SAMP',))
-            parent_id_pairs.columns = ['samp_id', 'comp_id']
+            parent_id_pairs = table_id_pairs(tables[group], 'SAMP')
             parent_id_pairs = clean_ids(parent_id_pairs)
 
             if no_parent_ids := sorted(list(set(parent_id_pairs['samp_id']).difference(set(samp_ids)))):
@@ -409,8 +428,7 @@ def check_sample_referencing(tables: dict) -> List[dict]:
     # Check data
     try:
         sample = tables['SAMP']
-        samp_id_pairs = sample.apply(id_pair, axis=1, args=('SAMP',))
-        samp_id_pairs.columns = ['samp_id', 'comp_id']
+        samp_id_pairs = table_id_pairs(sample, 'SAMP')
         errors, samp_id_pairs = internal_consistency('SAMP', samp_id_pairs)
         child_errors = child_consistency(samp_id_pairs['samp_id'], tables)
         errors.extend(child_errors)
@@ -24,6 +24,10 @@ def extract_geojson(filepath: Path) -> dict:
     """
     logger.info("Extracting geojson from %s", filepath.name)
 
+    # Don't try to parse files that are not .ags format
+    if filepath.suffix.lower() != '.ags':
+        raise ValueError(f"ERROR: {filepath.name} is not an .ags file")
+
     # Read data file
     tables, load_error, _ = load_tables_reporting_errors(filepath)
     if load_error:
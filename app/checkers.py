@@ -4,7 +4,6 @@ to do with opening the files.
 """
 import logging
 from pathlib import Path
-import re
 from typing import Tuple, Optional, Dict, List
 
 import python_ags4
@@ -15,6 +14,9 @@ from app.bgs_rules import BGS_RULES, bgs_rules_version
 
 logger = logging.getLogger(__name__)
 
+# Fragments of AGS TYPE codes for numeric data (e.g. 2DP, MC, 3SF, 2SCI)
+_NUMERIC_TYPE_CODES = ('DP', 'MC', 'SF', 'SCI')
+
 
 def check_ags(filename: Path, standard_AGS4_dictionary: Optional[str] = None) -> dict:
     if standard_AGS4_dictionary:
@@ -38,7 +40,8 @@ def check_ags(filename: Path, standard_AGS4_dictionary: Optional[str] = None) ->
             dictionary = ''
 
     except UnicodeDecodeError as err:
-        line_no = len(err.object[:err.end].split(b'\n'))
+        # Count newlines in place rather than slicing and splitting the file
+        line_no = err.object.count(b'\n', 0, err.end) + 1
         description = f"UnicodeDecodeError: {err.reason}"
         errors = {'File read error': [{'line': line_no, 'group': '', 'desc': description}]}
         dictionary = ''
@@ -187,11 +190,14 @@ def get_coord_column_type_errors(tables: dict, coord_columns: List[str]) -> dict
     for column in coord_columns:
         try:
             type_ = loca.loc[loca['HEADING'] == 'TYPE', column].tolist()[0]
-            if not re.search(r'(DP|MC|SF|SCI)', type_):
-                bad_columns.append(f"{column} ({type_})")
-        except KeyError:
-            # Ignore columns that don't exist
-            pass
+        except (KeyError, IndexError):
+            # Ignore columns that don't exist and groups without a TYPE row,
+            # which are reported by the AGS checker
+            continue
+
+        # TYPE may be missing (None or NaN) rather than a string
+        if not isinstance(type_, str) or not any(code in type_ for code in _NUMERIC_TYPE_CODES):
+            bad_columns.append(f"{column} ({type_})")
 
     if bad_columns:
         error_message = f"Coordinate columns have non-numeric TYPE: {', '.join(bad_columns)}"
@@ -18,8 +18,7 @@ def convert(filename: Path, results_dir: Path, sorting_strategy: Optional[str] =
     new_extension = '.ags' if filename.suffix == '.xlsx' else '.xlsx'
     converted_file = results_dir / (filename.stem + new_extension)
     logger.info("Converting %s to %s", filename.name, converted_file.name)
-    if not results_dir.exists():
-        results_dir.mkdir()
+    results_dir.mkdir(exist_ok=True)
 
     # Prepare response with metadata
     response = _prepare_response_metadata(filename)
@@ -3,6 +3,7 @@ import os
 import time
 
 import colorlog
+import rich
 import shortuuid
 
 from fastapi import FastAPI, status
@@ -62,9 +63,19 @@ def setup_logging(logging_level=logging.INFO):
         f"'logging_level': {logging.getLevelName(logging_level)}")
 
 
+def silence_console_output():
+    """
+    python_ags4 prints progress and error messages for every file to stdout
+    via the shared rich console.  These duplicate the errors that are returned
+    in the response, so switch the console off rather than write them out.
+    """
+    rich.get_console().quiet = True
+
+
 app = FastAPI(root_path=os.getenv('PYAGSAPI_ROOT_PATH', ''))
 
 setup_logging()
+silence_console_output()
 
 # Add routes
 app.include_router(routes.router)
@@ -114,18 +125,20 @@ app.openapi = custom_openapi
 async def log_requests(request: Request, call_next):
     if request.client and not request.client.host.startswith('10.'):
         logger = logging.getLogger('request')
-        logger.info(f"called by {request.client.host}")
+        # Use lazy %-formatting so that URLs and headers are only converted to
+        # strings if the message is actually logged
+        logger.info("called by %s", request.client.host)
         req_id = shortuuid.ShortUUID().random(length=8)
-        logger.info(f"Request: id: {req_id} path: {request.url}")
-        logger.debug(f"Request: id: {req_id} headers: {request.headers}")
+        logger.info("Request: id: %s path: %s", req_id, request.url)
+        logger.debug("Request: id: %s headers: %s", req_id, request.headers)
         start_time = time.time()
 
     response = await call_next(request)
 
     if request.client and not request.client.host.startswith('10.'):
         call_time = int((time.time() - start_time) * 1000)
-        logger.info(f"Request: id: {req_id} status: {response.status_code}, time: {call_time} ms")
-        logger.debug(f"Request: id: {req_id} response headers: {response.headers}")
+        logger.info("Request: id: %s status: %s, time: %s ms", req_id, response.status_code, call_time)
+        logger.debug("Request: id: %s response headers: %s", req_id, response.headers)
 
     return response
 
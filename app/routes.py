@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import List
 
 from fastapi import APIRouter, BackgroundTasks, File, Form, Query, Request, UploadFile, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.exceptions import HTTPException
 
@@ -26,6 +27,9 @@ BOREHOLE_EXPORT_URL = "https://gwbv.bgs.ac.uk/ags_export?loca_ids={bgs_loca_id}"
 BOREHOLE_INDEX_URL = ("https://ogcapi.bgs.ac.uk/collections/agsboreholeindex/items?f=json"
                       "&properties=bgs_loca_id&filter=INTERSECTS(shape,{polygon})&limit=10")
 
+# Line written between the results for each file in plain text logs
+LOG_SEPARATOR = '=' * 80 + '\n'
+
 # Get AGS_API_ENV, defaults to DEVELOP if not set or not recognised.
 AGS_API_ENV = os.getenv("AGS_API_ENV", "DEVELOP").upper()
 
@@ -221,14 +225,16 @@ async def validate(background_tasks: BackgroundTasks,
 
     data = []
     for file in files:
-        contents = await file.read()
         local_ags_file = tmp_dir / file.filename
-        local_ags_file.write_bytes(contents)
-        result = validation.validate(
+        await run_in_threadpool(save_upload, file, local_ags_file)
+        # Checks are CPU-bound, so run them in the worker thread pool to keep
+        # the event loop free to serve other requests
+        result = await run_in_threadpool(
+            validation.validate,
             local_ags_file, checkers=checkers, standard_AGS4_dictionary=dictionary)
         if return_geometry:
             try:
-                geojson = extract_geojson(local_ags_file)
+                geojson = await run_in_threadpool(extract_geojson, local_ags_file)
                 result['geojson'] = geojson
             except ValueError as ve:
                 result['geojson'] = {}
@@ -238,11 +244,11 @@ async def validate(background_tasks: BackgroundTasks,
     if fmt == Format.TEXT:
         full_logfile = tmp_dir / 'results.log'
         with full_logfile.open('wt') as f:
-            f.write('=' * 80 + '\n')
+            f.write(LOG_SEPARATOR)
             for result in data:
                 log = validation.to_plain_text(result)
                 f.write(log)
-                f.write('=' * 80 + '\n')
+                f.write(LOG_SEPARATOR)
         response = FileResponse(full_logfile, media_type="text/plain")
     else:
         response = prepare_validation_response(request, data)
@@ -251,14 +257,22 @@ async def validate(background_tasks: BackgroundTasks,
 
 
 def prepare_validation_response(request, data):
-    """Package the data into a Response schema object"""
+    """
+    Package the data into a ValidationResponse schema object and return it
+    serialised as a JSON Response.  Returning the model itself would make
+    FastAPI convert and validate every result a second time against the
+    response_model.  The JSON is written with the same settings as
+    Starlette's JSONResponse.
+    """
     response_data = {
         'msg': f'{len(data)} files validated',
         'type': 'success',
         'self': get_request_url(request),
         'data': data,
     }
-    return ValidationResponse(**response_data, media_type="application/json")
+    validation_response = ValidationResponse(**response_data)
+    content = validation_response.json(ensure_ascii=False, allow_nan=False, separators=(',', ':'))
+    return Response(content, media_type="application/json")
 
 
 @router.post("/convert/",
@@ -298,15 +312,15 @@ async def convert(background_tasks: BackgroundTasks,
     results_dir.mkdir()
     full_logfile = results_dir / 'conversion.log'
     with full_logfile.open('wt') as f:
-        f.write('=' * 80 + '\n')
+        f.write(LOG_SEPARATOR)
         for file in files:
-            contents = await file.read()
             local_file = tmp_dir / file.filename
-            local_file.write_bytes(contents)
-            converted, result = conversion.convert(local_file, results_dir, sorting_strategy=sort_tables)
+            await run_in_threadpool(save_upload, file, local_file)
+            converted, result = await run_in_threadpool(
+                conversion.convert, local_file, results_dir, sorting_strategy=sort_tables)
             log = validation.to_plain_text(result)
             f.write(log)
-            f.write('\n' + '=' * 80 + '\n')
+            f.write(f'\n{LOG_SEPARATOR}')
     zipped_file = tmp_dir / RESULTS
     shutil.make_archive(zipped_file, 'zip', results_dir)
     zipped_stream = open(tmp_dir / (RESULTS + '.zip'), 'rb')
@@ -504,6 +518,15 @@ def prepare_count_response(request, count):
     return BoreholeCountResponse(**response_data, media_type="application/json")
 
 
+def save_upload(file: UploadFile, destination: Path):
+    """
+    Stream uploaded file to destination in chunks, rather than reading the
+    whole upload into memory first.
+    """
+    with destination.open('wb') as f:
+        shutil.copyfileobj(file.file, f)
+
+
 def get_request_url(request):
     """ External calls need https to be returned, so check environment."""
     request_url = str(request.url)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Dict, List, Union
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, validator
 
 from app.bgs_rules import BGS_RULES
 
@@ -27,9 +27,14 @@ VALID_KEYS.append('BGS data validation: Non-numeric coordinate types')
 
 
 class LineError(BaseModel):
-    line: Union[int, str] = Field(..., example="5")
-    group: str = Field(..., example="TRAN")
-    desc: str = Field(..., example="Blah blah")
+    line: Union[int, str]
+    group: str
+    desc: str
+
+    class Config:
+        schema_extra = {
+            'example': {'line': 5, 'group': 'TRAN', 'desc': 'Blah blah'}
+        }
 
     @validator('line')
     def line_if_string_must_be_hyphen(cls, line):
@@ -39,18 +44,34 @@ class LineError(BaseModel):
 
 
 class Validation(BaseModel):
-    filename: str = Field(..., example="example.ags")
-    filesize: int = Field(None, example="1024")
-    checkers: List[str] = Field(None, example=["python_ags4 v0.4.1"])
-    dictionary: str = Field(None, example="Standard_dictionary_v4_1_1.ags")
-    time: datetime = Field(None, example="2021-08-18 09:23:29")
-    message: str = Field(None, example="7 error(s) found in file!")
-    errors: Dict[str, List[LineError]] = Field(..., example="Rule 1a")
-    valid: bool = Field(..., example='false')
-    additional_metadata: dict = Field(...)
+    filename: str
+    filesize: int = None
+    checkers: List[str] = None
+    dictionary: str = None
+    time: datetime = None
+    message: str = None
+    errors: Dict[str, List[LineError]]
+    valid: bool
+    additional_metadata: dict
     geojson: dict = dict()
     geojson_error: str = None
 
+    class Config:
+        schema_extra = {
+            'example': {
+                'filename': 'example.ags',
+                'filesize': 1024,
+                'checkers': ['python_ags4 v0.4.1'],
+                'dictionary': 'Standard_dictionary_v4_1_1.ags',
+                'time': '2021-08-18 09:23:29',
+                'message': '7 error(s) found in file!',
+                'errors': {'AGS Format Rule 4': [
+                    {'line': 5, 'group': 'TRAN', 'desc': 'Blah blah'}]},
+                'valid': False,
+                'additional_metadata': {},
+            }
+        }
+
     @validator('errors')
     def errors_keys_must_be_known_rules(cls, errors):
         for key in errors.keys():
@@ -59,24 +80,61 @@ class Validation(BaseModel):
 
 
 class Error(BaseModel):
-    error: str = Field(..., example="error")
-    propName:  str = Field(None, example="error")
-    desc: str = Field(..., example="Error message")
+    error: str
+    propName: str = None
+    desc: str
+
+    class Config:
+        schema_extra = {
+            'example': {'error': 'error', 'propName': 'error', 'desc': 'Error message'}
+        }
 
 
 class MinimalResponse(BaseModel):
-    msg: str = Field(..., example="Example response")
-    type: str = Field(..., example="success")
-    self: str = Field(..., example="http://example.com/apis/query")
+    msg: str
+    type: str
+    self: str
+
+    class Config:
+        schema_extra = {
+            'example': {'msg': 'Example response', 'type': 'success',
+                        'self': 'http://example.com/apis/query'}
+        }
 
 
 class ErrorResponse(MinimalResponse):
     errors: List[Error] = None
 
+    class Config:
+        schema_extra = {
+            'example': {
+                'msg': 'Not found',
+                'type': 'bad request',
+                'self': 'http://example.com/apis/query',
+                'errors': [Error.Config.schema_extra['example']],
+            }
+        }
+
 
 class ValidationResponse(MinimalResponse):
     data: List[Union[Validation, bool]] = None
 
+    class Config:
+        schema_extra = {
+            'example': {
+                'msg': '1 files validated',
+                'type': 'success',
+                'self': 'http://example.com/apis/query',
+                'data': [Validation.Config.schema_extra['example']],
+            }
+        }
+
 
 class BoreholeCountResponse(MinimalResponse):
-    count: int = Field(..., example=4)
+    count: int
+
+    class Config:
+        schema_extra = {
+            'example': {'msg': 'Borehole count', 'type': 'success',
+                        'self': 'http://example.com/apis/query', 'count': 4}
+        }
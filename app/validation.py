@@ -2,10 +2,12 @@
 The validate function calls checkers to validate files and combines the
 results in the requested format.
 """
+from collections import OrderedDict
 import datetime as dt
-from functools import reduce
+import hashlib
 import logging
 from pathlib import Path
+import threading
 from typing import Optional, Callable, List
 
 import python_ags4
@@ -15,10 +17,78 @@ from app.response_templates import PLAIN_TEXT_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
+UTC = dt.timezone.utc
+
 # Collect full paths of dictionaries installed alongside python_ags4
 _dictionary_files = list(Path(python_ags4.__file__).parent.glob('Standard_dictionary*.ags'))
 STANDARD_DICTIONARIES = {f.name: f.absolute() for f in _dictionary_files}
 
+# Results for recently validated files are cached against a hash of their
+# contents, as the same file is often uploaded many times while it is fixed.
+# Responses take roughly as much memory as the file itself, so the cache is
+# limited by the total size of the files whose results it holds.
+VALIDATION_CACHE_SIZE = 128
+VALIDATION_CACHE_MAX_BYTES = 100 * 1024 * 1024
+MAX_CACHED_FILESIZE = 5 * 1024 * 1024  # bytes
+
+
+class ValidationCache:
+    """
+    Thread-safe least-recently-used cache of validation responses, limited by
+    number of entries and by the total size of the validated files.
+    """
+
+    def __init__(self, maxsize: int, maxbytes: int):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._responses = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[dict]:
+        with self._lock:
+            try:
+                self._responses.move_to_end(key)
+            except KeyError:
+                return None
+            response, _ = self._responses[key]
+            return _copy_response(response)
+
+    def put(self, key: tuple, response: dict, filesize: int):
+        if filesize > self.maxbytes:
+            return
+
+        with self._lock:
+            if key in self._responses:
+                self._total_bytes -= self._responses.pop(key)[1]
+            self._responses[key] = (_copy_response(response), filesize)
+            self._total_bytes += filesize
+
+            while (len(self._responses) > self.maxsize
+                   or self._total_bytes > self.maxbytes):
+                _, (_, evicted_size) = self._responses.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._responses.clear()
+            self._total_bytes = 0
+
+    def __len__(self):
+        return len(self._responses)
+
+
+def _copy_response(response: dict) -> dict:
+    """
+    Copy the response and its errors dictionary so that callers can add or
+    replace keys without changing the cached version.  The lists of errors
+    are shared, as copying them is expensive for files with many errors.
+    """
+    return {**response, 'errors': dict(response['errors'])}
+
+
+validation_cache = ValidationCache(VALIDATION_CACHE_SIZE, VALIDATION_CACHE_MAX_BYTES)
+
 
 def validate(filename: Path,
              checkers: List[Callable[[Path], dict]] = [check_ags],
@@ -45,6 +115,15 @@ def validate(filename: Path,
     else:
         dictionary_file = None
 
+    # Reuse the result from an earlier upload of the same file, if available
+    cache_key = _get_cache_key(filename, response['filesize'], checkers, dictionary_file)
+    if cache_key:
+        cached_response = validation_cache.get(cache_key)
+        if cached_response:
+            logger.info("Using cached result for %s", filename.name)
+            cached_response['time'] = response['time']
+            return cached_response
+
     all_errors = {}
     all_checkers = []
     additional_metadata_responses = {'bgs': {}, 'ags': {}}
@@ -80,7 +159,7 @@ def validate(filename: Path,
     else:
         response['additional_metadata'] = additional_metadata_responses['ags']
 
-    error_count = len(reduce(lambda total, current: total + current, all_errors.values(), []))
+    error_count = sum(len(rule_errors) for rule_errors in all_errors.values())
     if error_count > 0:
         message = f'{error_count} error(s) found in file!'
         valid = False
@@ -90,6 +169,9 @@ def validate(filename: Path,
 
     response.update(errors=all_errors, message=message, valid=valid, checkers=all_checkers)
 
+    if cache_key:
+        validation_cache.put(cache_key, response, response['filesize'])
+
     return response
 
 
@@ -98,6 +180,27 @@ def to_plain_text(response: dict) -> str:
     return PLAIN_TEXT_TEMPLATE.render(response)
 
 
+def _get_cache_key(filename: Path, filesize: int,
+                   checkers: List[Callable[[Path], dict]],
+                   dictionary_file: Optional[Path]) -> Optional[tuple]:
+    """
+    Build key identifying a validation job from a SHA-256 hash of the file
+    contents and the validation options.  filesize is taken from the response
+    metadata to avoid another stat call.  Return None if the result should not
+    be cached e.g. for large, missing or non-.ags files.
+    """
+    if filename.suffix.lower() != '.ags' or filesize > MAX_CACHED_FILESIZE:
+        return None
+
+    try:
+        with filename.open('rb') as f:
+            digest = hashlib.file_digest(f, 'sha256').hexdigest()
+    except FileNotFoundError:
+        return None
+
+    return (digest, filename.name, tuple(checkers), dictionary_file)
+
+
 def _prepare_response_metadata(filename: Path) -> dict:
     """
     Prepare a dictionary containing metadata to include in the response.
@@ -109,7 +212,7 @@ def _prepare_response_metadata(filename: Path) -> dict:
 
     response = {'filename': filename.name,
                 'filesize': filesize,
-                'time': dt.datetime.now(tz=dt.timezone.utc),
+                'time': dt.datetime.now(tz=UTC),
                 # The following are usually overwritten
                 'message': '',
                 'dictionary': '',
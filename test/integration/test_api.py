@@ -4,15 +4,18 @@ import os
 from pathlib import Path
 import zipfile
 
+from fastapi.encoders import jsonable_encoder
 from fastapi.testclient import TestClient
 from freezegun import freeze_time
 import pytest
 from httpx import AsyncClient
+from starlette.responses import JSONResponse
 import requests
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 import pandas as pd
 from python_ags4 import AGS4
 
+from app import validation
 from app.main import app
 from app.checkers import load_ags4_as_numeric
 import app.routes as app_routes
@@ -25,6 +28,23 @@ IN_GITHUB_ACTIONS = os.getenv("GITHUB_ACTIONS") == "true"
 TEST_FILE_DIR = Path(__file__).parent.parent / 'files'
 
 
+def test_prepare_validation_response_matches_json_response():
+    """Pre-serialised body matches what JSONResponse would have returned."""
+    # Arrange
+    data = [validation.validate(TEST_FILE_DIR / 'example_broken_ags.ags')]
+    data[0]['message'] += ' (non-ASCII: é)'
+    request = type('MockRequest', (), {'url': 'http://example.com/validate/'})
+
+    # Act
+    response = app_routes.prepare_validation_response(request, data)
+
+    # Assert
+    model = app_routes.ValidationResponse(msg='1 files validated', type='success',
+                                          self=request.url, data=data)
+    assert response.media_type == 'application/json'
+    assert response.body == JSONResponse(jsonable_encoder(model)).body
+
+
 def test_openapi_json(client):
     """ Check that the openapi is accessible and it display the correct endpoints """
     response = client.get('/openapi.json')
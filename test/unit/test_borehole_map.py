@@ -44,6 +44,8 @@ def test_extract_geojson_example_ags():
      'Line 106 does not have the same number of entries as the HEADING row in GEOL.'),
     (TEST_FILE_DIR / 'real' / 'AGS3' / 'PE131061.ags',
      'ERROR: File cannot be read, please use AGS checker to confirm format errors'),
+    (TEST_FILE_DIR / 'example_xlsx.xlsx',
+     'ERROR: example_xlsx.xlsx is not an .ags file'),
 ])
 def test_extract_geojson_bad_files(ags_filepath, expected_error):
     # Act and assert
@@ -1,10 +1,12 @@
 """These tests confirm that the checkers can handle various exceptions"""
+from copy import deepcopy
 from pathlib import Path
 
+import pandas as pd
 import pytest
 import python_ags4
 
-from app.checkers import check_bgs, check_ags
+from app.checkers import check_bgs, check_ags, get_coord_column_type_errors
 from app.bgs_rules import bgs_rules_version
 
 TEST_FILE_DIR = Path(__file__).parent.parent / 'files'
@@ -17,6 +19,31 @@ AGS_FILE_DATA = {
 }
 
 
+def make_cached_checker(checker):
+    """
+    Return function that runs checker on a test file, parsing each file only
+    once per session.  Copies are returned so tests can modify the results.
+    """
+    results = {}
+
+    def check(filename):
+        if filename not in results:
+            results[filename] = checker(TEST_FILE_DIR / filename)
+        return deepcopy(results[filename])
+
+    return check
+
+
+@pytest.fixture(scope='session')
+def ags_result():
+    return make_cached_checker(check_ags)
+
+
+@pytest.fixture(scope='session')
+def bgs_result():
+    return make_cached_checker(check_bgs)
+
+
 @pytest.mark.parametrize('filename, expected_rules', [
     ('example_ags.ags', set()),
     ('random_binary.ags', {'General', 'AGS Format Rule 1', 'AGS Format Rule 2a', 'AGS Format Rule 3',
@@ -32,13 +59,10 @@ AGS_FILE_DATA = {
     ('real/AGS3/19684.ags', {'AGS Format Rule 3'}),
     ('real/AGS3/E52A4379 (2).ags', {'AGS Format Rule 3'}),
 ])
-def test_check_ags(filename, expected_rules):
+def test_check_ags(ags_result, filename, expected_rules):
     """Check that broken rules are returned and exceptions handled correctly."""
-    # Arrange
-    filename = TEST_FILE_DIR / filename
-
     # Act
-    result = check_ags(filename)
+    result = ags_result(filename)
 
     # Assert
     # Check that metadata fields are correct
@@ -74,13 +98,10 @@ def test_check_ags(filename, expected_rules):
     # This file crashes because it asks for user input
     # ('real/E52A4379 (2).ags', {}),
 ])
-def test_check_bgs(filename, expected_rules, file_read_message):
+def test_check_bgs(bgs_result, filename, expected_rules, file_read_message):
     """Check different rules and file_read_messages are reported correctly."""
-    # Arrange
-    filename = TEST_FILE_DIR / filename
-
     # Act
-    result = check_bgs(filename)
+    result = bgs_result(filename)
 
     # Assert
     # Check that metadata fields are correct
@@ -116,17 +137,14 @@ def test_check_bgs(filename, expected_rules, file_read_message):
         'bgs_loca_rows': '2 data row(s) in LOCA group',
         'bgs_projects': '1 projects found: 7500/75 (Southwark)'}),
 ])
-def test_check_additional_metadata(filename, expected_metadata):
+def test_check_additional_metadata(ags_result, bgs_result, filename, expected_metadata):
     """
     Check addtional metadata is added correctly.  The AGS results don't
     contain as much data as the BGS results.
     """
-    # Arrange
-    filename = TEST_FILE_DIR / filename
-
     # Act
-    result_bgs = check_bgs(filename)['additional_metadata']
-    result_ags = check_ags(filename)['additional_metadata']
+    result_bgs = bgs_result(filename)['additional_metadata']
+    result_ags = ags_result(filename)['additional_metadata']
 
     # Assert
     assert result_bgs == expected_metadata
@@ -135,3 +153,27 @@ def test_check_additional_metadata(filename, expected_metadata):
     assert result_ags.pop('bgs_projects') is None
     for key in result_ags:
         assert result_ags[key] == expected_metadata[key]
+
+
+@pytest.mark.parametrize('headings, nate_values, expected_desc', [
+    (['TYPE', 'DATA'], ['2DP', '123456.78'], None),
+    (['TYPE', 'DATA'], ['X', '123456.78'],
+     'Coordinate columns have non-numeric TYPE: LOCA_NATE (X)'),
+    (['TYPE', 'DATA'], [None, '123456.78'],
+     'Coordinate columns have non-numeric TYPE: LOCA_NATE (None)'),
+    (['UNIT', 'DATA'], ['m', '123456.78'], None),
+])
+def test_get_coord_column_type_errors(headings, nate_values, expected_desc):
+    """Check missing TYPE rows and values are handled without crashing."""
+    # Arrange
+    tables = {'LOCA': pd.DataFrame({'HEADING': headings, 'LOCA_NATE': nate_values})}
+
+    # Act
+    errors = get_coord_column_type_errors(tables, ['LOCA_NATE', 'LOCA_NATN'])
+
+    # Assert
+    if expected_desc:
+        [error] = errors['BGS data validation: Non-numeric coordinate types']
+        assert error['desc'] == expected_desc
+    else:
+        assert errors == {}
@@ -2,7 +2,8 @@
 import pytest
 from pydantic.error_wrappers import ValidationError
 
-from app.schemas import Validation
+from app.schemas import (BoreholeCountResponse, Error, ErrorResponse, LineError,
+                         MinimalResponse, Validation, ValidationResponse)
 from test.fixtures_json import JSON_RESPONSES, BROKEN_JSON_RESPONSES
 
 
@@ -18,3 +19,19 @@ def test_validation(filename, data):
 def test_failed_validation(data):
     with pytest.raises(ValidationError):
         Validation(**data)
+
+
+@pytest.mark.parametrize('model, expected_keys', [
+    (LineError, {'line', 'group', 'desc'}),
+    (Validation, {'filename', 'errors', 'valid', 'additional_metadata'}),
+    (Error, {'error', 'desc'}),
+    (MinimalResponse, {'msg', 'type', 'self'}),
+    (ErrorResponse, {'msg', 'type', 'self', 'errors'}),
+    (ValidationResponse, {'msg', 'type', 'self', 'data'}),
+    (BoreholeCountResponse, {'msg', 'type', 'self', 'count'}),
+])
+def test_schema_examples(model, expected_keys):
+    """Each model documents its own example, which must itself be valid."""
+    example = model.schema()['example']
+    assert expected_keys <= set(example.keys())
+    model(**example)
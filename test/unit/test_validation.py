@@ -201,6 +201,81 @@ def test_validate_custom_dictionary_bad_file():
         assert key in message
 
 
+def test_validate_uses_cached_result():
+    """Repeat validation of the same file returns copy of cached result."""
+    # Arrange
+    filename = TEST_FILE_DIR / 'example_ags.ags'
+    calls = []
+
+    def counting_check_ags(filename, standard_AGS4_dictionary=None):
+        calls.append(filename)
+        return mock_check_ags(filename, standard_AGS4_dictionary)
+
+    validation.validation_cache.clear()
+
+    # Act
+    first_response = validation.validate(filename, checkers=[counting_check_ags])
+    first_response['errors']['General'] = []
+    second_response = validation.validate(filename, checkers=[counting_check_ags])
+
+    # Assert
+    assert len(calls) == 1
+    assert second_response['filename'] == 'example_ags.ags'
+    assert second_response['errors'] == {}
+    assert second_response['valid']
+
+
+def test_validate_cache_key_includes_options():
+    """Different checkers or dictionaries are not served from the cache."""
+    # Arrange
+    filename = TEST_FILE_DIR / 'example_ags.ags'
+    dictionary_file = validation.STANDARD_DICTIONARIES['Standard_dictionary_v4_1_1.ags']
+
+    # Act
+    filesize = filename.stat().st_size
+    ags_key = validation._get_cache_key(filename, filesize, [mock_check_ags], None)
+    bgs_key = validation._get_cache_key(filename, filesize, [mock_check_bgs], None)
+    dictionary_key = validation._get_cache_key(filename, filesize, [mock_check_ags], dictionary_file)
+    non_ags_key = validation._get_cache_key(TEST_FILE_DIR / 'example_xlsx.xlsx', filesize,
+                                            [mock_check_ags], None)
+    large_file_key = validation._get_cache_key(filename, validation.MAX_CACHED_FILESIZE + 1,
+                                               [mock_check_ags], None)
+
+    # Assert
+    assert len({ags_key, bgs_key, dictionary_key}) == 3
+    assert non_ags_key is None
+    assert large_file_key is None
+
+
+def test_validation_cache_eviction():
+    """Oldest entries are evicted when entry or byte limits are exceeded."""
+    # Arrange
+    cache = validation.ValidationCache(maxsize=3, maxbytes=100)
+    response = {'filename': 'example.ags', 'errors': {}}
+
+    # Act and assert
+    # Byte limit
+    cache.put('a', response, 40)
+    cache.put('b', response, 40)
+    assert cache.get('a') is not None  # 'a' is now most recently used
+    cache.put('c', response, 40)
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('c') is not None
+
+    # Entry limit
+    cache.put('d', response, 1)
+    cache.put('e', response, 1)
+    assert len(cache) == 3
+    assert cache.get('a') is None
+    assert {key for key in 'cde' if cache.get(key)} == {'c', 'd', 'e'}
+
+    # Files larger than the byte limit are never stored
+    cache.put('f', response, 101)
+    assert cache.get('f') is None
+    assert len(cache) == 3
+
+
 @pytest.mark.parametrize('filename', [
     'example_ags.ags', 'example_broken_ags.ags', 'nonsense.AGS',
     'random_binary.ags', 'real/Blackburn Southern Bypass.ags'])